@@ -5,23 +5,17 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
+import copy
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
-app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
-
-# Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
 
-# In-memory activity database
-# In-memory activity database
-activities = {
+# Initial contents of the in-memory activity database
+default_activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
@@ -79,53 +73,73 @@ activities = {
 }
 
 
-@app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
+def create_app(initial_activities=None):
+    """
+    Build a new app instance that owns its own in-memory activity database.
+
+    Returns the app together with its activities dict so callers (e.g. tests)
+    can inspect and reset state without touching any module-level globals.
+    """
+    if initial_activities is None:
+        initial_activities = default_activities
+    activities = copy.deepcopy(initial_activities)
+
+    app = FastAPI(title="Mergington High School API",
+                  description="API for viewing and signing up for extracurricular activities")
+
+    # Mount the static files directory
+    app.mount("/static", StaticFiles(directory=os.path.join(current_dir,
+              "static")), name="static")
+
+    @app.get("/")
+    def root():
+        return RedirectResponse(url="/static/index.html")
 
+    @app.get("/activities")
+    def get_activities() -> dict[str, dict]:
+        return activities
 
-@app.get("/activities")
-def get_activities():
-    return activities
+    @app.post("/activities/{activity_name}/signup")
+    def signup_for_activity(activity_name: str, email: str) -> dict[str, str]:
+        """Sign up a student for an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
+        # Get the specific activity
+        activity = activities[activity_name]
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Validate activity is not full
+        if len(activity["participants"]) >= activity["max_participants"]:
+            raise HTTPException(status_code=400, detail="Activity is full")
 
-    # Get the specific activity
-    activity = activities[activity_name]
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student is already signed up for this activity")
 
-    # Validate activity is not full
-    if len(activity["participants"]) >= activity["max_participants"]:
-        raise HTTPException(status_code=400, detail="Activity is full")
+        # Add student
+        activity["participants"].append(email)
+        return {"message": f"Signed up {email} for {activity_name}"}
 
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student is already signed up for this activity")
+    @app.delete("/activities/{activity_name}/unregister")
+    def unregister_participant(activity_name: str, email: str) -> dict[str, str]:
+        """Unregister a student from an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Add student
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+        # Get the specific activity
+        activity = activities[activity_name]
 
+        # Validate student is registered
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student is not registered for this activity")
 
-@app.delete("/activities/{activity_name}/unregister")
-def unregister_participant(activity_name: str, email: str):
-    """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Remove student
+        activity["participants"].remove(email)
+        return {"message": f"Unregistered {email} from {activity_name}"}
 
-    # Get the specific activity
-    activity = activities[activity_name]
+    return app, activities
 
-    # Validate student is registered
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student is not registered for this activity")
 
-    # Remove student
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
\ No newline at end of file
+app, activities = create_app()
@@ -0,0 +1,91 @@
+"""
+Shared pytest configuration and fixtures for the test suite
+"""
+
+import copy
+import httpx
+import pytest
+from src.app import create_app
+
+
+# Activities database used by every test, built once at import
+_TEST_DATA = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 2,
+        "participants": ["alice@test.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 3,
+        "participants": []
+    },
+    "Full Activity": {
+        "description": "An activity at capacity",
+        "schedule": "Mondays, 2:00 PM - 3:00 PM",
+        "max_participants": 1,
+        "participants": ["bob@test.edu"]
+    }
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --run-slow is given"""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def app_and_state():
+    """
+    Fixture: Build an isolated app instance with its own test activities.
+    Session scope means one instance per xdist worker, so workers never share state.
+    """
+    return create_app(_TEST_DATA)
+
+
+@pytest.fixture(scope="session")
+async def client(app_and_state):
+    """
+    Fixture: Create a single async client that calls the app in-process.
+    Opened once as a context manager, so setup and teardown happen once per session.
+    """
+    app, _ = app_and_state
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                 base_url="http://testserver") as client:
+        yield client
+
+
+@pytest.fixture
+def fresh_activities(app_and_state):
+    """
+    Fixture: Reset the shared activities database to _TEST_DATA and yield it.
+    Uses the Arrange step of AAA pattern; every test that mutates activities
+    must request this fixture so it starts from a clean state.
+    """
+    _, activities = app_and_state
+    
+    # Drop activities a previous test added and re-insert any it removed
+    for name in activities.keys() - _TEST_DATA.keys():
+        del activities[name]
+    for name in _TEST_DATA.keys() - activities.keys():
+        activities[name] = copy.deepcopy(_TEST_DATA[name])
+    
+    # Only participant lists are mutated, so restore just those in place
+    for name, data in _TEST_DATA.items():
+        activities[name]["participants"][:] = data["participants"]
+    
+    return activities
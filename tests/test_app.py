@@ -8,429 +8,307 @@ Uses the AAA (Arrange-Act-Assert) pattern:
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Fixture: Create a test client for the FastAPI app"""
-    return TestClient(app)
+ACTIVITIES = "/activities"
+CHESS_SIGNUP = "/activities/Chess Club/signup"
+CHESS_UNREG = "/activities/Chess Club/unregister"
+PROG_SIGNUP = "/activities/Programming Class/signup"
+PROG_UNREG = "/activities/Programming Class/unregister"
+FULL_SIGNUP = "/activities/Full Activity/signup"
+FULL_UNREG = "/activities/Full Activity/unregister"
 
 
-@pytest.fixture
-def fresh_activities():
+# Tests for GET /activities endpoint
+
+async def test_get_all_activities_success(client, fresh_activities):
+    """
+    Test: Retrieving all activities returns success with correct structure
+    
+    Arrange: Test data is in fresh_activities fixture
+    Act: Make GET request to /activities
+    Assert: Verify 200 status and response contains expected activities
+    """
+    # Act
+    response = await client.get(ACTIVITIES)
+    
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert "Chess Club" in data
+    assert "Programming Class" in data
+    assert "Full Activity" in data
+    assert len(data) == 3
+
+
+async def test_get_activities_contains_required_fields(client, fresh_activities):
+    """
+    Test: Each activity has required fields
+    
+    Arrange: Test data is in fresh_activities fixture
+    Act: Make GET request and extract first activity
+    Assert: Verify all required fields are present
+    """
+    # Act
+    response = await client.get(ACTIVITIES)
+    activities_data = response.json()
+    chess_club = activities_data["Chess Club"]
+    
+    # Assert
+    assert "description" in chess_club
+    assert "schedule" in chess_club
+    assert "max_participants" in chess_club
+    assert "participants" in chess_club
+
+
+async def test_get_activities_shows_current_participants(client, fresh_activities):
+    """
+    Test: Participant list is returned correctly
+    
+    Arrange: Chess Club has alice@test.edu in participants
+    Act: Get activities and check Chess Club
+    Assert: Verify correct participants are shown
+    """
+    # Act
+    response = await client.get(ACTIVITIES)
+    activities_data = response.json()
+    
+    # Assert
+    assert activities_data["Chess Club"]["participants"] == ["alice@test.edu"]
+    assert activities_data["Programming Class"]["participants"] == []
+
+
+# Tests for POST /activities/{activity_name}/signup endpoint
+
+async def test_signup_success(client, fresh_activities):
     """
-    Fixture: Reset activities database to a clean state for each test.
-    Uses the Arrange step of AAA pattern.
+    Test: Student successfully signs up for an activity
+    
+    Arrange: Programming Class has 0 participants, 1 spot available
+    Act: POST signup request with valid email and activity
+    Assert: Verify 200 status, success message and that the participant was added
     """
-    # Store original state
-    original_activities = activities.copy()
+    # Act
+    response = await client.post(
+        PROG_SIGNUP, params={"email": "charlie@test.edu"}
+    )
     
-    # Clear and populate with test data
-    activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 2,
-            "participants": ["alice@test.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 3,
-            "participants": []
-        },
-        "Full Activity": {
-            "description": "An activity at capacity",
-            "schedule": "Mondays, 2:00 PM - 3:00 PM",
-            "max_participants": 1,
-            "participants": ["bob@test.edu"]
-        }
-    })
+    # Assert
+    assert response.status_code == 200
+    message = response.json()["message"]
+    assert "charlie@test.edu" in message
+    assert "Programming Class" in message
+    assert fresh_activities["Programming Class"]["participants"] == ["charlie@test.edu"]
+
+
+async def test_signup_same_student_different_activities(client, fresh_activities):
+    """
+    Test: Same student can sign up for different activities
     
-    yield activities
+    Arrange: alice@test.edu is in Chess Club, Programming Class is open
+    Act: Sign up alice for Programming Class
+    Assert: Verify 200 status - success
+    """
+    # Act
+    response = await client.post(
+        PROG_SIGNUP, params={"email": "alice@test.edu"}
+    )
     
-    # Restore original state after test
-    activities.clear()
-    activities.update(original_activities)
+    # Assert
+    assert response.status_code == 200
+    assert "alice@test.edu" in fresh_activities["Programming Class"]["participants"]
 
 
-class TestGetActivities:
-    """Tests for GET /activities endpoint"""
+async def test_signup_respects_capacity_limit(client, fresh_activities):
+    """
+    Test: Can add multiple students up to capacity limit
+    
+    Arrange: Programming Class has max_participants=3
+    Act: Sign up multiple students sequentially
+    Assert: Verify all are added until capacity is reached
+    """
+    # Act - Sign up 2 more students (1 spot left)
+    response1 = await client.post(
+        PROG_SIGNUP, params={"email": "liam@test.edu"}
+    )
+    response2 = await client.post(
+        PROG_SIGNUP, params={"email": "mia@test.edu"}
+    )
     
-    def test_get_all_activities_success(self, client, fresh_activities):
-        """
-        Test: Retrieving all activities returns success with correct structure
-        
-        Arrange: Test data is in fresh_activities fixture
-        Act: Make GET request to /activities
-        Assert: Verify 200 status and response contains expected activities
-        """
-        # Act
-        response = client.get("/activities")
-        
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Full Activity" in data
-        assert len(data) == 3
+    # Assert both succeeded
+    assert response1.status_code == 200
+    assert response2.status_code == 200
+    assert len(fresh_activities["Programming Class"]["participants"]) == 2
+
+
+# Tests for DELETE /activities/{activity_name}/unregister endpoint
+
+async def test_unregister_success(client, fresh_activities):
+    """
+    Test: Student successfully unregisters from activity
     
-    def test_get_activities_contains_required_fields(self, client, fresh_activities):
-        """
-        Test: Each activity has required fields
-        
-        Arrange: Test data is in fresh_activities fixture
-        Act: Make GET request and extract first activity
-        Assert: Verify all required fields are present
-        """
-        # Act
-        response = client.get("/activities")
-        activities_data = response.json()
-        chess_club = activities_data["Chess Club"]
-        
-        # Assert
-        assert "description" in chess_club
-        assert "schedule" in chess_club
-        assert "max_participants" in chess_club
-        assert "participants" in chess_club
+    Arrange: alice@test.edu is in Chess Club
+    Act: DELETE request to unregister from Chess Club
+    Assert: Verify 200 status, success message and that the participant was removed
+    """
+    # Act
+    response = await client.delete(
+        CHESS_UNREG, params={"email": "alice@test.edu"}
+    )
     
-    def test_get_activities_shows_current_participants(self, client, fresh_activities):
-        """
-        Test: Participant list is returned correctly
-        
-        Arrange: Chess Club has alice@test.edu in participants
-        Act: Get activities and check Chess Club
-        Assert: Verify correct participants are shown
-        """
-        # Act
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        # Assert
-        assert activities_data["Chess Club"]["participants"] == ["alice@test.edu"]
-        assert activities_data["Programming Class"]["participants"] == []
-
-
-class TestSignupForActivity:
-    """Tests for POST /activities/{activity_name}/signup endpoint"""
+    # Assert
+    assert response.status_code == 200
+    message = response.json()["message"]
+    assert "alice@test.edu" in message
+    assert "Unregistered" in message
+    assert fresh_activities["Chess Club"]["participants"] == []
+
+
+async def test_unregister_frees_spot_for_signup(client, fresh_activities):
+    """
+    Test: After unregistering, someone else can sign up
     
-    def test_signup_success(self, client, fresh_activities):
-        """
-        Test: Student successfully signs up for an activity
-        
-        Arrange: Programming Class has 0 participants, 1 spot available
-        Act: POST signup request with valid email and activity
-        Assert: Verify 200 status and success message
-        """
-        # Act
-        response = client.post(
-            "/activities/Programming Class/signup?email=charlie@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 200
-        assert "charlie@test.edu" in response.json()["message"]
-        assert "Programming Class" in response.json()["message"]
+    Arrange: Full Activity is at capacity (bob@test.edu)
+    Act: Unregister bob, then try to sign up henry
+    Assert: Verify henry can successfully sign up
+    """
+    # Act - First unregister
+    await client.delete(FULL_UNREG, params={"email": "bob@test.edu"})
     
-    def test_signup_adds_participant_to_activity(self, client, fresh_activities):
-        """
-        Test: Participant is actually added to activity's participants list
-        
-        Arrange: Programming Class has 0 participants
-        Act: Sign up a student and verify by fetching activities
-        Assert: Verify participant count increases
-        """
-        # Act
-        client.post("/activities/Programming Class/signup?email=david@test.edu")
-        response = client.get("/activities")
-        
-        # Assert
-        updated_programming = response.json()["Programming Class"]
-        assert "david@test.edu" in updated_programming["participants"]
-        assert len(updated_programming["participants"]) == 1
+    # Act - Now try to sign up new person
+    response = await client.post(
+        FULL_SIGNUP, params={"email": "henry@test.edu"}
+    )
     
-    def test_signup_activity_not_found(self, client, fresh_activities):
-        """
-        Test: Signing up for non-existent activity returns 404
-        
-        Arrange: No "Nonexistent Club" in activities
-        Act: POST signup for non-existent activity
-        Assert: Verify 404 status and error message
-        """
-        # Act
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=eve@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+    # Assert
+    assert response.status_code == 200
+    assert "henry@test.edu" in fresh_activities["Full Activity"]["participants"]
+    assert "bob@test.edu" not in fresh_activities["Full Activity"]["participants"]
+
+
+# Tests for error paths of the signup and unregister endpoints
+
+@pytest.mark.parametrize("method,path,email,status,detail", [
+    ("post", "/activities/Nonexistent Club/signup", "eve@test.edu", 404, b"Activity not found"),
+    ("post", FULL_SIGNUP, "frank@test.edu", 400, b"Activity is full"),
+    ("post", CHESS_SIGNUP, "alice@test.edu", 400, b"already signed up"),
+    ("delete", "/activities/Phantom Club/unregister", "alice@test.edu", 404, b"Activity not found"),
+    ("delete", CHESS_UNREG, "grace@test.edu", 400, b"not registered"),
+], ids=[
+    "signup-activity-not-found",
+    "signup-activity-full",
+    "signup-duplicate-student",
+    "unregister-activity-not-found",
+    "unregister-student-not-registered",
+])
+async def test_error_response(client, fresh_activities, method, path, email, status, detail):
+    """
+    Test: Invalid signup/unregister requests return the expected error
     
-    def test_signup_activity_full(self, client, fresh_activities):
-        """
-        Test: Signing up for full activity returns 400
-        
-        Arrange: Full Activity has max_participants=1 and 1 participant (bob)
-        Act: POST signup for the full activity
-        Assert: Verify 400 status and "Activity is full" message
-        """
-        # Act
-        response = client.post(
-            "/activities/Full Activity/signup?email=frank@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 400
-        assert "Activity is full" in response.json()["detail"]
+    Arrange: Chess Club has alice, Full Activity is at capacity, Nonexistent/Phantom Club do not exist
+    Act: Send the request described by the parameters
+    Assert: Verify error status and detail message
+    """
+    # Act
+    response = await getattr(client, method)(path, params={"email": email})
     
-    def test_signup_duplicate_student(self, client, fresh_activities):
-        """
-        Test: Student cannot sign up twice for same activity
-        
-        Arrange: alice@test.edu is already in Chess Club
-        Act: POST signup for Chess Club with same email
-        Assert: Verify 400 status and duplicate error message
-        """
-        # Act
-        response = client.post(
-            "/activities/Chess Club/signup?email=alice@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+    # Assert
+    assert response.status_code == status
+    assert detail in response.content
+
+
+# Tests for GET / endpoint
+
+async def test_root_redirect(client):
+    """
+    Test: Root endpoint redirects to static index.html
     
-    def test_signup_same_student_different_activities(self, client, fresh_activities):
-        """
-        Test: Same student can sign up for different activities
-        
-        Arrange: alice@test.edu is in Chess Club, Programming Class is open
-        Act: Sign up alice for Programming Class
-        Assert: Verify 200 status - success
-        """
-        # Act
-        response = client.post(
-            "/activities/Programming Class/signup?email=alice@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 200
-        activities_data = client.get("/activities").json()
-        assert "alice@test.edu" in activities_data["Programming Class"]["participants"]
+    Arrange: Test client ready
+    Act: GET request to /
+    Assert: Verify redirect status (307 or 308) and location header
+    """
+    # Act
+    response = await client.get("/", follow_redirects=False)
     
-    def test_signup_respects_capacity_limit(self, client, fresh_activities):
-        """
-        Test: Can add multiple students up to capacity limit
-        
-        Arrange: Programming Class has max_participants=3
-        Act: Sign up multiple students sequentially
-        Assert: Verify all are added until capacity is reached
-        """
-        # Act - Sign up 2 more students (1 spot left)
-        response1 = client.post(
-            "/activities/Programming Class/signup?email=liam@test.edu"
-        )
-        response2 = client.post(
-            "/activities/Programming Class/signup?email=mia@test.edu"
-        )
-        
-        # Assert both succeeded
-        assert response1.status_code == 200
-        assert response2.status_code == 200
-        activities_data = client.get("/activities").json()
-        assert len(activities_data["Programming Class"]["participants"]) == 2
-
-
-class TestUnregisterParticipant:
-    """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
+    # Assert
+    assert response.status_code in [307, 308]
+    assert "/static/index.html" in response.headers["location"]
+
+
+@pytest.mark.slow
+async def test_root_redirect_target_is_served(client):
+    """
+    Test: The page the root endpoint redirects to is served
     
-    def test_unregister_success(self, client, fresh_activities):
-        """
-        Test: Student successfully unregisters from activity
-        
-        Arrange: alice@test.edu is in Chess Club
-        Act: DELETE request to unregister from Chess Club
-        Assert: Verify 200 status and success message
-        """
-        # Act
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=alice@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 200
-        assert "alice@test.edu" in response.json()["message"]
-        assert "Unregistered" in response.json()["message"]
+    Arrange: Test client ready
+    Act: GET request to /, then GET the redirect target
+    Assert: Verify the target returns 200
+    """
+    # Act
+    response = await client.get("/", follow_redirects=False)
+    response = await client.get(response.headers["location"])
     
-    def test_unregister_removes_participant(self, client, fresh_activities):
-        """
-        Test: Participant is actually removed from activity's list
-        
-        Arrange: alice@test.edu is in Chess Club
-        Act: Unregister and fetch activities to verify
-        Assert: Verify participant count decreases
-        """
-        # Act
-        client.delete("/activities/Chess Club/unregister?email=alice@test.edu")
-        response = client.get("/activities")
-        
-        # Assert
-        updated_chess = response.json()["Chess Club"]
-        assert "alice@test.edu" not in updated_chess["participants"]
-        assert len(updated_chess["participants"]) == 0
+    # Assert
+    assert response.status_code == 200
+
+
+# Tests for edge cases and special scenarios
+
+async def test_email_with_special_characters_encoded(client, fresh_activities):
+    """
+    Test: Email addresses with special characters are handled correctly
     
-    def test_unregister_activity_not_found(self, client, fresh_activities):
-        """
-        Test: Unregistering from non-existent activity returns 404
-        
-        Arrange: No "Phantom Club" in activities
-        Act: DELETE unregister for non-existent activity
-        Assert: Verify 404 status
-        """
-        # Act
-        response = client.delete(
-            "/activities/Phantom Club/unregister?email=alice@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+    Arrange: Email with + sign (valid email)
+    Act: Sign up with special character email
+    Assert: Verify signup succeeds and email is preserved
+    """
+    # Act
+    response = await client.post(
+        PROG_SIGNUP + "?email=test%2Balias@test.edu"
+    )
     
-    def test_unregister_student_not_registered(self, client, fresh_activities):
-        """
-        Test: Unregistering non-existent student returns 400
-        
-        Arrange: grace@test.edu is not in any activity
-        Act: DELETE unregister for student not in activity
-        Assert: Verify 400 status and error message
-        """
-        # Act
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=grace@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 400
-        assert "not registered" in response.json()["detail"]
+    # Assert
+    assert response.status_code == 200
+    assert "test+alias@test.edu" in fresh_activities["Programming Class"]["participants"]
+
+
+async def test_activity_name_with_spaces_encoded(client, fresh_activities):
+    """
+    Test: Activity names with spaces are handled correctly
     
-    def test_unregister_frees_spot_for_signup(self, client, fresh_activities):
-        """
-        Test: After unregistering, someone else can sign up
-        
-        Arrange: Full Activity is at capacity (bob@test.edu)
-        Act: Unregister bob, then try to sign up henry
-        Assert: Verify henry can successfully sign up
-        """
-        # Act - First unregister
-        client.delete("/activities/Full Activity/unregister?email=bob@test.edu")
-        
-        # Act - Now try to sign up new person
-        response = client.post(
-            "/activities/Full Activity/signup?email=henry@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 200
-        activities_data = client.get("/activities").json()
-        assert "henry@test.edu" in activities_data["Full Activity"]["participants"]
-        assert "bob@test.edu" not in activities_data["Full Activity"]["participants"]
-
-
-class TestRootEndpoint:
-    """Tests for GET / endpoint"""
+    Arrange: Programming Class has spaces in name
+    Act: Sign up for activity with spaces (URL encoded)
+    Assert: Verify request succeeds
+    """
+    # Act
+    response = await client.post(
+        "/activities/Programming%20Class/signup?email=ivy@test.edu"
+    )
     
-    def test_root_redirect(self, client):
-        """
-        Test: Root endpoint redirects to static index.html
-        
-        Arrange: Test client ready
-        Act: GET request to /
-        Assert: Verify redirect status (307 or 308)
-        """
-        # Act
-        response = client.get("/", follow_redirects=False)
-        
-        # Assert
-        assert response.status_code in [307, 308]
-        assert "/static/index.html" in response.headers["location"]
+    # Assert
+    assert response.status_code == 200
+
+
+async def test_sequential_signups_and_unregisters(client, fresh_activities):
+    """
+    Test: Multiple sequential operations maintain correct state
     
-    def test_root_redirect_follows(self, client):
-        """
-        Test: Following redirect from / to index.html
-        
-        Arrange: Test client ready
-        Act: GET request to / with follow_redirects=True
-        Assert: Verify final response is HTML (200 or follows redirect)
-        """
-        # Act
-        response = client.get("/", follow_redirects=True)
-        
-        # Assert - The redirect should work
-        assert response.status_code == 200
-
-
-class TestEdgeCases:
-    """Tests for edge cases and special scenarios"""
+    Arrange: Programming Class is empty
+    Act: Sign up 3 people, unregister 1, sign up another
+    Assert: Verify final state is correct
+    """
+    # Act - Sign up multiple people
+    await client.post(PROG_SIGNUP, params={"email": "jack@test.edu"})
+    await client.post(PROG_SIGNUP, params={"email": "kate@test.edu"})
     
-    def test_email_with_special_characters_encoded(self, client, fresh_activities):
-        """
-        Test: Email addresses with special characters are handled correctly
-        
-        Arrange: Email with + sign (valid email)
-        Act: Sign up with special character email
-        Assert: Verify signup succeeds and email is preserved
-        """
-        # Act
-        response = client.post(
-            "/activities/Programming Class/signup?email=test%2Balias@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 200
-        activities_data = client.get("/activities").json()
-        assert "test+alias@test.edu" in activities_data["Programming Class"]["participants"]
+    # Verify count
+    participants = fresh_activities["Programming Class"]["participants"]
+    assert len(participants) == 2
     
-    def test_activity_name_with_spaces_encoded(self, client, fresh_activities):
-        """
-        Test: Activity names with spaces are handled correctly
-        
-        Arrange: Programming Class has spaces in name
-        Act: Sign up for activity with spaces (URL encoded)
-        Assert: Verify request succeeds
-        """
-        # Act
-        response = client.post(
-            "/activities/Programming%20Class/signup?email=ivy@test.edu"
-        )
-        
-        # Assert
-        assert response.status_code == 200
+    # Unregister one
+    await client.delete(PROG_UNREG, params={"email": "jack@test.edu"})
     
-    def test_sequential_signups_and_unregisters(self, client, fresh_activities):
-        """
-        Test: Multiple sequential operations maintain correct state
-        
-        Arrange: Programming Class is empty
-        Act: Sign up 3 people, unregister 1, sign up another
-        Assert: Verify final state is correct
-        """
-        # Act - Sign up multiple people
-        client.post("/activities/Programming Class/signup?email=jack@test.edu")
-        client.post("/activities/Programming Class/signup?email=kate@test.edu")
-        
-        # Verify count
-        response = client.get("/activities")
-        assert len(response.json()["Programming Class"]["participants"]) == 2
-        
-        # Unregister one
-        client.delete("/activities/Programming Class/unregister?email=jack@test.edu")
-        
-        # Verify count decreased
-        response = client.get("/activities")
-        assert len(response.json()["Programming Class"]["participants"]) == 1
-        assert "kate@test.edu" in response.json()["Programming Class"]["participants"]
-        assert "jack@test.edu" not in response.json()["Programming Class"]["participants"]
+    # Verify count decreased
+    assert len(participants) == 1
+    assert "kate@test.edu" in participants
+    assert "jack@test.edu" not in participants